@@ -8,7 +8,12 @@ import shutil
 import os
 import json
 import logging
+import logging.handlers
+import queue
+import collections
 from datetime import datetime
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import re
 import sys
@@ -16,8 +21,134 @@ import platform
 import ctypes
 import signal
 import time
+import tempfile
+import selectors
+
+# ==================== HELPERS ====================
+@lru_cache(maxsize=256)
+def _truncate_display(text, limit=80):
+    """Shorten long file names for single-line labels"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+def _prefetch_dir(path):
+    """Hint the kernel to read a directory ahead of rclone (Linux only, best effort)"""
+    if not hasattr(os, "posix_fadvise") or not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        fd = os.open(path, os.O_DIRECTORY | os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+def _scan_dirs(pending, cancel=None):
+    """Return (total_bytes, file_count) for regular files under the given directories"""
+    # scandir gives sizes from the DirEntry (no separate getsize per file);
+    # symlinks are skipped, matching rclone's default
+    total_size = 0
+    file_count = 0
+    pending = list(pending)
+    while pending:
+        # a cancelled scan returns a partial count; callers discard it
+        if cancel is not None and cancel.is_set():
+            break
+        path = pending.pop()
+        _prefetch_dir(path)
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                            file_count += 1
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+    return total_size, file_count
+
+def _walk_sizes(path, workers=1, cancel=None):
+    """Return (total_bytes, file_count) for regular files under path, scanning subdirectories in parallel"""
+    if workers <= 1:
+        return _scan_dirs([path], cancel)
+    
+    total_size = 0
+    file_count = 0
+    subdirs = []
+    _prefetch_dir(path)
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+                        file_count += 1
+                except OSError:
+                    pass
+    except OSError:
+        return 0, 0
+    
+    # a card with a single clip folder gains nothing from a pool
+    if len(subdirs) < 2:
+        size, count = _scan_dirs(subdirs, cancel)
+        return total_size + size, file_count + count
+    
+    with ThreadPoolExecutor(max_workers=min(workers, len(subdirs))) as pool:
+        futures = [pool.submit(_scan_dirs, [d], cancel) for d in subdirs]
+        for future in as_completed(futures):
+            size, count = future.result()
+            total_size += size
+            file_count += count
+    return total_size, file_count
 
 # ==================== LOGGER ====================
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records within the same second"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = None
+        self._last_ts = ""
+    
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_ts = super().formatTime(record, datefmt)
+            self._last_sec = sec
+        return self._last_ts
+
+class _BufferedFileHandler(logging.FileHandler):
+    """File handler with a 64 KiB write buffer that only flushes on warnings/errors"""
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=65536, encoding=self.encoding)
+    
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+# queued by DITLogger.flush(); the listener thread flushes instead of logging it
+_FLUSH_RECORD = logging.makeLogRecord({"msg": "flush"})
+
+class _BatchingHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also writes through to disk when it sees the flush marker"""
+    def emit(self, record):
+        if record is _FLUSH_RECORD:
+            self.flush()
+            self.target.flush()
+        else:
+            super().emit(record)
+
 class DITLogger:
     def __init__(self, log_dir="./dit_logs"):
         self.log_dir = Path(log_dir)
@@ -25,13 +156,23 @@ class DITLogger:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file = self.log_dir / f"transfer_{timestamp}.log"
         
-        logging.basicConfig(
-            filename=str(self.log_file),
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
+        # Callers only enqueue records; a single listener thread owns the file.
+        self._file_handler = _BufferedFileHandler(str(self.log_file), delay=True)
+        self._file_handler.setFormatter(_CachedTimeFormatter(
+            '%(asctime)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+        # Batch records so bursty rclone output reaches the file in chunks
+        self._memory_handler = _BatchingHandler(
+            capacity=512, flushLevel=logging.WARNING, target=self._file_handler
         )
+        self._log_queue = log_queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(log_queue, self._memory_handler)
+        self._listener.start()
+        
         self.logger = logging.getLogger()
+        self.logger.setLevel(logging.INFO)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     def info(self, msg):
         self.logger.info(msg)
@@ -44,17 +185,38 @@ class DITLogger:
     
     def warning(self, msg):
         self.logger.warning(msg)
+    
+    def flush(self):
+        """Push everything logged so far through to the log file"""
+        # Queued behind the pending records, so the listener writes those first.
+        self._log_queue.put(_FLUSH_RECORD)
+    
+    def close(self):
+        """Drain pending records and close the log file"""
+        try:
+            self._listener.stop()
+        except Exception:
+            pass
+        self._memory_handler.close()
+        self._file_handler.close()
 
 # ==================== CONFIG MANAGER ====================
 class ConfigManager:
     CONFIG_FILE = "dit_config.json"
+    _last_saved_json = None
+    
+    @staticmethod
+    def _dumps(config):
+        return json.dumps(config, separators=(',', ':'))
     
     @staticmethod
     def load():
         if os.path.exists(ConfigManager.CONFIG_FILE):
             try:
                 with open(ConfigManager.CONFIG_FILE, 'r') as f:
-                    return json.load(f)
+                    config = json.load(f)
+                ConfigManager._last_saved_json = ConfigManager._dumps(config)
+                return config
             except Exception as e:
                 print(f"Error loading config: {e}")
                 return {}
@@ -63,12 +225,33 @@ class ConfigManager:
     @staticmethod
     def save(config):
         try:
-            with open(ConfigManager.CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
+            payload = ConfigManager._dumps(config)
+            if payload == ConfigManager._last_saved_json:
+                return
+            # write-then-rename so an interrupted save never leaves a truncated file
+            tmp_path = ConfigManager.CONFIG_FILE + ".tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, ConfigManager.CONFIG_FILE)
+            ConfigManager._last_saved_json = payload
         except Exception as e:
             print(f"Error saving config: {e}")
 
 # ==================== TRANSFER ENGINE ====================
+# rclone output patterns, compiled once; parse_rclone_progress runs on every output line
+_COPIED_RE = re.compile(r'INFO\s*:\s*(.+?): (?:Multi-thread )?Copied \(')
+# Stats fields are matched by three small independent patterns over the whole
+# line rather than one alternation, so each field is found without retrying
+# every branch at every position. Only _ETA_RE starts with a literal and gets
+# the regex engine's prefix scan; the other two require a literal ("%", "/s")
+# after their digits, which keeps them from matching elsewhere on the line.
+_PCT_RE = re.compile(r'(\d+)%')
+_SPEED_RE = re.compile(r'(?<=\s)([\d.]+)\s*([KMGT]?i?B(?:ytes)?)/s')
+_ETA_RE = re.compile(r'ETA\s+(\S+)')
+_TRANSFERRING_RE = re.compile(r'\*\s+(\S.*?):\s*\d+%\s*/')
+_FILTER_SPECIAL_RE = re.compile(r'([\\*?\[\]{}])')
+_NO_HASH_RE = re.compile(r'no .*hash|no .*checksum|hash .*not supported|cannot .*checksum|unable to compute|not supported', re.IGNORECASE)
+
 class PauseRequested(Exception):
     pass
 
@@ -76,6 +259,13 @@ class AbortRequested(Exception):
     pass
 
 class TransferEngine:
+    # minimum seconds between progress/current-file updates sent to the UI
+    UI_UPDATE_INTERVAL = 0.1
+    # seconds without any output before rclone check / ascmhl is treated as hung;
+    # ascmhl -v prints per file, but hashing one large clip can still take a while
+    CHECK_STALL_TIMEOUT = 120
+    MHL_STALL_TIMEOUT = 3600
+    
     def __init__(self, logger, ui_callback):
         self.logger = logger
         self.ui_callback = ui_callback
@@ -83,9 +273,17 @@ class TransferEngine:
         self.stopped = False
         self.paused = False
         self.aborted = False
+        # dst -> relative paths rclone reported as copied (and hash-checked) during copy
+        self.verified_files = {}
+        # set by abort() so a long preflight walk of the source stops early
+        self._scan_cancel = threading.Event()
+        # latest reader values not yet sent to the UI (see UI_UPDATE_INTERVAL)
+        self._last_ui_ts = 0.0
+        self._pending_file = None
+        self._pending_progress = None
         
-    def preflight_check(self, src, dst):
-        """Verify paths and disk space before transfer"""
+    def preflight_check(self, src, dsts, transfers=4, scan_cache=None):
+        """Verify paths and disk space on every destination before transfer"""
         if not os.path.exists(src):
             raise ValueError(f"Source path does not exist: {src}")
         if not os.path.isdir(src):
@@ -93,126 +291,88 @@ class TransferEngine:
         if not os.listdir(src):
             raise ValueError("Source directory is empty")
         
-        if not os.path.exists(dst):
-            raise ValueError(f"Destination path does not exist: {dst}")
-        if not os.path.isdir(dst):
-            raise ValueError(f"Destination is not a directory: {dst}")
+        for dst in dsts:
+            if not os.path.exists(dst):
+                raise ValueError(f"Destination path does not exist: {dst}")
+            if not os.path.isdir(dst):
+                raise ValueError(f"Destination is not a directory: {dst}")
         
-        src_size = 0
-        file_count = 0
-        for root, dirs, files in os.walk(src):
-            for file in files:
-                try:
-                    file_path = os.path.join(root, file)
-                    src_size += os.path.getsize(file_path)
-                    file_count += 1
-                except OSError:
-                    pass
+        # the source is sized once, whatever the number of destinations
+        # scan_cache: (path, root_mtime_ns, size, count) from the UI's source scan
+        if scan_cache and scan_cache[0] == src and os.stat(src).st_mtime_ns == scan_cache[1]:
+            src_size, file_count = scan_cache[2], scan_cache[3]
+        else:
+            src_size, file_count = _walk_sizes(src, workers=transfers * 2, cancel=self._scan_cancel)
+            if self._scan_cancel.is_set():
+                raise AbortRequested("Transfer aborted by user")
         
         if file_count == 0:
             raise ValueError("No files found in source directory")
         
-        try:
-            dst_stats = shutil.disk_usage(dst)
-            dst_free = dst_stats.free
-        except Exception as e:
-            raise ValueError(f"Unable to determine destination disk usage: {e}")
-        
-        if src_size > dst_free * 0.95:
-            raise ValueError(
-                f"Insufficient space.\n"
-                f"Required: {src_size/1e9:.2f} GB\n"
-                f"Available: {dst_free/1e9:.2f} GB"
-            )
+        for dst in dsts:
+            try:
+                dst_stats = shutil.disk_usage(dst)
+                dst_free = dst_stats.free
+            except Exception as e:
+                raise ValueError(f"Unable to determine destination disk usage: {e}")
+            
+            if src_size > dst_free * 0.95:
+                raise ValueError(
+                    f"Insufficient space on {dst}.\n"
+                    f"Required: {src_size/1e9:.2f} GB\n"
+                    f"Available: {dst_free/1e9:.2f} GB"
+                )
         
         self.logger.info(f"Preflight check passed: {file_count} files, {src_size/1e9:.2f} GB")
         return src_size, file_count
     
     def parse_rclone_progress(self, line):
         """Extract progress info from rclone output"""
+        # Every line we care about has a colon; skip the rest before any regex runs.
+        if ":" not in line:
+            return None
+        
+        # "INFO  : clip/A001.mov: Copied (new)" - rclone has already compared
+        # source and destination hashes for this file (copy runs with --checksum).
+        if "Copied (" in line:
+            m_copied = _COPIED_RE.search(line)
+            if m_copied:
+                return ("copied", m_copied.group(1))
+        
         # First, handle the aggregated "Transferred:" line which usually contains
         # overall percentage, speed, and ETA separated by commas.
-        if "Transferred:" in line:
+        if line.startswith("Transferred:"):
             try:
-                # Split on commas and trim
-                parts = [p.strip() for p in line.split(',')]
-                percentage = None
-                speed = None
-                eta = None
+                m_pct = _PCT_RE.search(line)
+                m_speed = _SPEED_RE.search(line)
+                m_eta = _ETA_RE.search(line)
                 
-                for p in parts:
-                    # Percentage field usually looks like "61%%"
-                    m_pct = re.search(r'(\d{1,3})\%', p)
-                    if m_pct and percentage is None:
-                        try:
-                            percentage = int(m_pct.group(1))
-                        except Exception:
-                            percentage = 0
-                        continue
-                    
-                    # Speed usually contains "/s"
-                    if '/s' in p and speed is None:
-                        speed = p
-                        continue
-                    
-                    # ETA may be prefixed with "ETA" or be a time-like token
-                    if p.upper().startswith('ETA') or re.match(r'^\d{1,2}:\d{2}(:\d{2})?$', p):
-                        # normalize "ETA 00:12:34" or "00:12:34"
-                        m_eta = re.search(r'ETA\s*[:\-]?\s*(\S+)', p, re.IGNORECASE)
-                        if m_eta:
-                            eta = m_eta.group(1)
-                        else:
-                            eta = p
-                        continue
+                # The second "Transferred:" line counts files ("3 / 10, 30%") and
+                # has no rate; don't let it reset the byte-based progress.
+                if m_speed is None and m_eta is None:
+                    return None
                 
-                # Fallback defaults
-                if percentage is None:
-                    percentage = 0
-                if speed is None:
-                    speed = "0 B/s"
-                if eta is None:
-                    eta = "---"
+                percentage = int(m_pct.group(1)) if m_pct else 0
+                speed = f"{m_speed.group(1)} {m_speed.group(2)}/s" if m_speed else "0 B/s"
+                eta = m_eta.group(1) if m_eta else "---"
                 
                 # Normalize speed string a bit (optional)
-                speed = speed.replace("MBytes", "MB").replace("KBytes", "KB").replace("GBytes", "GB")
+                if "Bytes" in speed:
+                    speed = speed.replace("MBytes", "MB").replace("KBytes", "KB").replace("GBytes", "GB")
                 
                 return ("progress", percentage, speed, eta)
             except Exception as e:
                 self.logger.error(f"Error parsing progress line '{line}': {e}")
                 return None
         
-        # Next, attempt to detect per-file progress lines.
-        try:
-            m = re.search(r'(?P<path>.+?):\s*\d{1,3}%%', line)
+        # Per-file lines in the "Transferring:" stanza:
+        # "* clip/A001.mov: 45% /1.2Gi, 10Mi/s, 1m0s"
+        if line.startswith("* "):
+            m = _TRANSFERRING_RE.match(line)
             if m:
-                path = m.group('path').strip()
-                file_matches = re.findall(r'([^\s:][^:]*\.[A-Za-z0-9]{1,5})', path)
-                if file_matches:
-                    filename = os.path.basename(file_matches[-1])
-                else:
-                    filename = os.path.basename(path)
-                if filename and len(filename) > 0:
-                    return ("file", filename)
-            
-            file_matches = re.findall(r'([^\s:][^:]*\.[A-Za-z0-9]{1,5}):', line)
-            if file_matches:
-                filename = os.path.basename(file_matches[-1])
-                if filename and len(filename) > 0:
+                filename = os.path.basename(m.group(1))
+                if filename:
                     return ("file", filename)
-            
-            if ("/" in line or "\\" in line) and ":" in line:
-                try:
-                    before_colon = line.rsplit(':', 1)[0]
-                    toks = re.split(r'\s+', before_colon.strip())
-                    for tok in reversed(toks):
-                        if '.' in tok:
-                            filename = os.path.basename(tok.strip())
-                            if filename:
-                                return ("file", filename)
-                except Exception:
-                    pass
-        except Exception as e:
-            self.logger.error(f"Error extracting file from line '{line}': {e}")
         
         return None
     
@@ -225,6 +385,11 @@ class TransferEngine:
             "rclone", "copy", src, dst,
             "--checksum",
             "--transfers", str(transfers),
+            "--checkers", str(max(transfers * 2, 8)),
+            "--fast-list",
+            "--buffer-size", "64M",
+            "--multi-thread-streams", "4",
+            "--multi-thread-cutoff", "100M",
             "--progress",
             "--stats", "1s",
             "-v"
@@ -234,37 +399,36 @@ class TransferEngine:
         self.ui_callback("log", "Starting file transfer with rclone...", "INFO")
         
         try:
+            # Binary pipe with a large buffer: lines are split here and only
+            # decoded when they can carry something parse_rclone_progress uses.
             self.process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
+                bufsize=1 << 17
             )
             
-            # Use readline loop for more reliable streaming across platforms
-            while True:
-                line = self.process.stdout.readline()
-                if line == '' and self.process.poll() is not None:
-                    break
-                if not line:
-                    # no data right now, avoid busy-loop
-                    time.sleep(0.01)
-                    continue
-                
+            buf = bytearray()
+            for chunk in self._read_output():
                 # If an abort or pause was requested externally, break and let the caller handle
                 if self.aborted or self.paused or self.stopped:
                     break
                 
-                line = line.strip()
-                if line:
-                    progress_data = self.parse_rclone_progress(line)
-                    if progress_data:
-                        if progress_data[0] == "file":
-                            self.ui_callback("current_file", progress_data[1])
-                        elif progress_data[0] == "progress":
-                            _, percentage, speed, eta = progress_data
-                            self.ui_callback("progress", percentage, speed, eta)
+                buf += chunk
+                # --progress redraws with \r as well as \n
+                cut = max(buf.rfind(b"\n"), buf.rfind(b"\r"))
+                if cut < 0:
+                    continue
+                complete = bytes(buf[:cut + 1])
+                del buf[:cut + 1]
+                for raw in complete.splitlines():
+                    if b":" in raw:
+                        self._process_rclone_line(raw.decode("utf-8", "replace").strip(), dst)
+            # after a stop/pause/abort the UI is being reset; don't repaint stale stats
+            if not (self.aborted or self.paused or self.stopped):
+                if b":" in buf:
+                    self._process_rclone_line(buf.decode("utf-8", "replace").strip(), dst)
+                self._flush_ui_updates()
             
             # Make sure process has ended
             try:
@@ -298,15 +462,104 @@ class TransferEngine:
             self.logger.error(f"Rclone execution error: {e}")
             raise
     
-    def verify_transfer(self, src, dst):
+    def _read_output(self):
+        """Yield chunks of rclone output until EOF or a stop/pause/abort request"""
+        if os.name == "nt":
+            # selectors can't wait on pipes on Windows; fall back to blocking reads
+            while True:
+                chunk = self.process.stdout.read1(65536)
+                if not chunk:
+                    return
+                yield chunk
+        
+        # Wake up every 100 ms even if rclone is silent, so a stalled
+        # transfer still reacts to the buttons promptly.
+        fd = self.process.stdout.fileno()
+        os.set_blocking(fd, False)
+        with selectors.DefaultSelector() as sel:
+            sel.register(fd, selectors.EVENT_READ)
+            while True:
+                if self.aborted or self.paused or self.stopped:
+                    try:
+                        self.process.terminate()
+                    except Exception:
+                        pass
+                    return
+                if not sel.select(0.1):
+                    continue
+                try:
+                    chunk = os.read(fd, 65536)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    return
+                yield chunk
+    
+    def _process_rclone_line(self, line, dst):
+        """Route one line of rclone copy output to the UI (throttled)"""
+        progress_data = self.parse_rclone_progress(line)
+        if not progress_data:
+            return
+        if progress_data[0] == "copied":
+            self.verified_files.setdefault(dst, set()).add(progress_data[1])
+            self._pending_file = os.path.basename(progress_data[1])
+        elif progress_data[0] == "file":
+            self._pending_file = progress_data[1]
+        elif progress_data[0] == "progress":
+            self._pending_progress = progress_data[1:]
+        
+        now = time.monotonic()
+        if now - self._last_ui_ts >= self.UI_UPDATE_INTERVAL:
+            self._last_ui_ts = now
+            self._flush_ui_updates()
+    
+    def _flush_ui_updates(self):
+        """Send the latest file/progress values held back by the throttle"""
+        if self._pending_file is not None:
+            self.ui_callback("current_file", self._pending_file)
+            self._pending_file = None
+        if self._pending_progress is not None:
+            self.ui_callback("progress", *self._pending_progress)
+            self._pending_progress = None
+    
+    def verify_transfer(self, src, dst, fast=False):
         """Independent verification using rclone check"""
         self.ui_callback("log", "Running independent verification pass...", "INFO")
         self.logger.info("Starting verification with rclone check")
         
+        def _run(cmd):
+            # periodic stats keep the stall watchdog fed during long checksum runs
+            return self._run_watched(cmd + ["--stats", "30s"], self.CHECK_STALL_TIMEOUT)
+        
+        # By default every file is re-hashed on both sides. Fast mode instead
+        # trusts the hashes rclone copy --checksum compared for the files it
+        # wrote: a size-only pass confirms nothing is missing or truncated, and
+        # the checksum pass below only covers files not copied this session.
+        trust_copied = False
+        if fast:
+            try:
+                result = _run(["rclone", "check", src, dst, "--size-only", "--one-way", "-v"])
+            except subprocess.TimeoutExpired:
+                raise ValueError("Verification timed out")
+            if result.returncode == 0:
+                self.logger.info("Size check passed; trusting copy-time checksums for copied files")
+                trust_copied = True
+            else:
+                self.logger.warning(f"rclone check (size-only) exit {result.returncode}. Output:\n{result.stdout}")
+                self.ui_callback("log", "Fast verification found differences; running full checksum verification...", "WARNING")
+        
         base_cmd = ["rclone", "check", src, dst, "-v"]
         
-        def _run(cmd):
-            return subprocess.run(cmd, capture_output=True, text=True, timeout=3600)
+        exclude_file = None
+        verified = self.verified_files.get(dst) if trust_copied else None
+        if verified:
+            with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as f:
+                for rel in sorted(verified):
+                    f.write("/" + _FILTER_SPECIAL_RE.sub(r'\\\1', rel) + "\n")
+                exclude_file = f.name
+            base_cmd += ["--exclude-from", exclude_file]
+            self.logger.info(f"Skipping {len(verified)} file(s) already verified by rclone during copy")
+            self.ui_callback("log", f"{len(verified)} file(s) verified during copy; checking the rest...", "INFO")
         
         try:
             # First try checksum-based verification (preferred)
@@ -323,10 +576,10 @@ class TransferEngine:
                 return True
             
             # If checksum failed, inspect output to see if checksums/hashes are not available/supported.
-            combined_output = (result.stderr or "") + "\n" + (result.stdout or "")
+            combined_output = result.stdout
             self.logger.info(f"rclone check (checksum) exit {result.returncode}. Output:\n{combined_output}")
             
-            if re.search(r'no .*hash|no .*checksum|hash .*not supported|cannot .*checksum|unable to compute|not supported', combined_output, re.I):
+            if _NO_HASH_RE.search(combined_output):
                 self.logger.warning("Checksum verification not supported for these remotes/filesystems. Falling back to size/modtime check.")
                 self.ui_callback("log", "Checksum verification not available; falling back to size/modtime verification", "WARNING")
                 
@@ -340,7 +593,7 @@ class TransferEngine:
                     self.logger.success("Verification passed (size/modtime)")
                     return True
                 else:
-                    combined_output2 = (result2.stderr or "") + "\n" + (result2.stdout or "")
+                    combined_output2 = result2.stdout
                     self.logger.error(f"rclone check (fallback) exit {result2.returncode}. Output:\n{combined_output2}")
                     raise ValueError("Verification failed: Files do not match")
             else:
@@ -352,6 +605,12 @@ class TransferEngine:
         except Exception as e:
             self.logger.error(f"Verification error: {e}")
             raise
+        finally:
+            if exclude_file:
+                try:
+                    os.remove(exclude_file)
+                except OSError:
+                    pass
     
     def create_mhl(self, dst):
         """Generate ASC-MHL manifest"""
@@ -362,15 +621,10 @@ class TransferEngine:
             raise FileNotFoundError("ascmhl not found in PATH. Please install ASC-MHL tools.")
         
         try:
-            result = subprocess.run(
-                ["ascmhl", "create", dst],
-                capture_output=True,
-                text=True,
-                timeout=3600
-            )
+            result = self._run_watched(["ascmhl", "create", "-v", dst], self.MHL_STALL_TIMEOUT)
             
             if result.returncode != 0:
-                raise ValueError(f"MHL creation failed: {result.stderr}")
+                raise ValueError(f"MHL creation failed: {result.stdout}")
             
             self.ui_callback("log", "MHL manifest created successfully", "SUCCESS")
             self.logger.success("MHL manifest created")
@@ -387,15 +641,10 @@ class TransferEngine:
         self.logger.info("Verifying MHL manifest")
         
         try:
-            result = subprocess.run(
-                ["ascmhl", "verify", dst],
-                capture_output=True,
-                text=True,
-                timeout=3600
-            )
+            result = self._run_watched(["ascmhl", "verify", "-v", dst], self.MHL_STALL_TIMEOUT)
             
             if result.returncode != 0:
-                raise ValueError(f"MHL verification failed: {result.stderr}")
+                raise ValueError(f"MHL verification failed: {result.stdout}")
             
             self.ui_callback("log", "MHL verification passed", "SUCCESS")
             self.logger.success("MHL verification passed")
@@ -406,34 +655,73 @@ class TransferEngine:
             self.logger.error(f"MHL verification error: {e}")
             raise
     
+    def _run_watched(self, cmd, stall_timeout):
+        """Run cmd to completion (stderr merged into stdout), killing it if it goes silent for stall_timeout seconds"""
+        if os.name == "nt":
+            # selectors can't wait on pipes on Windows; keep a wall-clock limit there
+            return subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                  text=True, errors="replace", timeout=3600)
+        
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        fd = process.stdout.fileno()
+        os.set_blocking(fd, False)
+        output = bytearray()
+        last_output = time.monotonic()
+        try:
+            with selectors.DefaultSelector() as sel:
+                sel.register(fd, selectors.EVENT_READ)
+                while True:
+                    if self.aborted:
+                        raise AbortRequested("Transfer aborted by user")
+                    if sel.select(0.5):
+                        try:
+                            chunk = os.read(fd, 65536)
+                        except BlockingIOError:
+                            continue
+                        if not chunk:
+                            break
+                        output += chunk
+                        last_output = time.monotonic()
+                    elif time.monotonic() - last_output > stall_timeout:
+                        self.logger.error(f"No output from {cmd[0]} for {stall_timeout}s, killing it")
+                        raise subprocess.TimeoutExpired(cmd, stall_timeout)
+            process.wait()
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            process.stdout.close()
+        return subprocess.CompletedProcess(cmd, process.returncode, output.decode("utf-8", "replace"))
+    
+    def _terminate_process(self, timeout=5):
+        """Terminate rclone and wait for the process itself to exit"""
+        # Never wait on the reader thread here: it posts to the Tk thread,
+        # which is usually the caller.
+        if not self.process or self.process.poll() is not None:
+            return False
+        try:
+            self.process.terminate()
+            self.process.wait(timeout=timeout)
+        except Exception:
+            try:
+                self.process.kill()
+            except Exception:
+                pass
+        return True
+
     def stop(self):
         """Stop current transfer (graceful stop). Kept for backward compatibility."""
         self.stopped = True
-        if self.process and self.process.poll() is None:
-            try:
-                self.process.terminate()
-                self.process.wait(timeout=5)
-            except:
-                try:
-                    self.process.kill()
-                except Exception:
-                    pass
+        if self._terminate_process():
             self.ui_callback("log", "Transfer stopped by user", "WARNING")
             self.logger.warning("Transfer stopped by user")
+        self.logger.flush()
 
     def pause(self):
         """Request a pause: terminate running rclone; the run method will raise PauseRequested."""
         self.paused = True
-        if self.process and self.process.poll() is None:
-            try:
-                # try to terminate gracefully
-                self.process.terminate()
-                self.process.wait(timeout=5)
-            except Exception:
-                try:
-                    self.process.kill()
-                except Exception:
-                    pass
+        self._terminate_process()
         self.ui_callback("log", "Pause requested - transfer will pause shortly", "INFO")
         self.logger.info("Pause requested by user")
 
@@ -443,23 +731,43 @@ class TransferEngine:
         self.ui_callback("log", "Resuming transfer...", "INFO")
         self.logger.info("Resume requested by user")
 
-    def abort(self):
+    def abort(self, timeout=5):
         """Request an abort: attempt to terminate process and signal abortion."""
         self.aborted = True
-        if self.process and self.process.poll() is None:
-            try:
-                self.process.terminate()
-                self.process.wait(timeout=5)
-            except Exception:
-                try:
-                    self.process.kill()
-                except Exception:
-                    pass
+        self._scan_cancel.set()
+        self._terminate_process(timeout)
         self.ui_callback("log", "Abort requested - transfer will stop", "WARNING")
         self.logger.warning("Abort requested by user")
 
 # ==================== MAIN APPLICATION ====================
+class _TransferJob:
+    """State of one started transfer that must survive a pause/resume"""
+    def __init__(self, engine, dest_count):
+        self.engine = engine
+        # verify + MHL of copied destinations, overlapping the next copy
+        self.stage_pool = ThreadPoolExecutor(max_workers=dest_count)
+        self.stages = []
+
 class ProfessionalDITApp(ctk.CTk):
+    EVENT_FLUSH_MS = 16
+    MAX_EVENTS_PER_FLUSH = 200
+    MAX_QUEUED_EVENTS = 4096
+    # events where only the most recent value matters
+    COALESCED_EVENTS = ("progress", "current_file")
+    # events that may be discarded when the queue is full (logs also go to the log file)
+    DROPPABLE_EVENTS = ("progress", "current_file", "log")
+    CONFIG_SAVE_DELAY_MS = 500
+    # log/queue views keep this many lines; trimming happens in chunks of LOG_TRIM_SLACK
+    MAX_LOG_LINES = 5000
+    LOG_TRIM_SLACK = 500
+    LOG_FLUSH_MS = 50
+    LOG_COLORS = {
+        "INFO": "#ffffff",
+        "SUCCESS": "#28a745",
+        "WARNING": "#ffc107",
+        "ERROR": "#dc3545"
+    }
+    
     def __init__(self):
         super().__init__()
         
@@ -480,15 +788,39 @@ class ProfessionalDITApp(ctk.CTk):
 
         # store current transfer args for resume
         self.current_transfer_args = None
+        
+        # selected paths, shown by the read-only entries in the media pool
+        self.src_path = tk.StringVar(value="")
+        self.dst1_path = tk.StringVar(value="")
+        self.dst2_path = tk.StringVar(value="")
+        
+        # (path, root mtime_ns, size, count) from the last source scan, reused by preflight
+        self._src_scan = None
+        # source scans run on a daemon thread; a newer browse (or closing) cancels the old one
+        self._scan_cancel = threading.Event()
+        self._scan_generation = 0
 
         # progress animation state (for 0-100 steps)
         self._current_percentage = 0
         self._target_percentage = 0
         self._progress_animating = False
+        self._last_progress = None
+        self._last_current_file = "Waiting..."
+        self._last_status = "Ready"
         
         # state lock to avoid races between UI and worker threads
         self._state_lock = threading.Lock()
         
+        # engine -> UI events, flushed in batches after <<DITEvent>>
+        self._event_queue = collections.deque()
+        self._event_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._closing = False
+        
+        # debounced config persistence
+        self._cfg_dirty = False
+        self._config_save_job = None
+        
         self.apply_scaling()
         self.check_dependencies()
         
@@ -506,6 +838,7 @@ class ProfessionalDITApp(ctk.CTk):
         self.setup_ui()
         self.load_saved_config()
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.bind("<<DITEvent>>", self._schedule_event_flush)
         
         try:
             self.log_path_label.configure(text=str(self.logger.log_file))
@@ -586,10 +919,8 @@ class ProfessionalDITApp(ctk.CTk):
         src_card = ctk.CTkFrame(left, fg_color="#161718", corner_radius=self.s(6))
         src_card.pack(fill="x", padx=self.s(10), pady=self.s(10))
         ctk.CTkLabel(src_card, text="Source", font=("Helvetica", self.sf(11), "bold")).pack(anchor="w", padx=self.s(8), pady=(self.s(8), 0))
-        self.src_display = ctk.CTkTextbox(src_card, height=self.s(48), fg_color="#0b0c0d", font=("Courier", self.sf(10)))
+        self.src_display = ctk.CTkEntry(src_card, textvariable=self.src_path, state="readonly", fg_color="#0b0c0d", font=("Courier", self.sf(10)))
         self.src_display.pack(fill="x", padx=self.s(8), pady=self.s(6))
-        self.src_display.insert("1.0", "No source selected")
-        self.src_display.configure(state="disabled")
         ctk.CTkButton(src_card, text="Browse...", command=lambda: self.browse("src"), width=self.s(120)).pack(padx=self.s(8), pady=(0, self.s(8)))
         self.src_info = ctk.CTkLabel(src_card, text="0 files | 0 GB", text_color="#9aa8b2", font=("Courier", self.sf(10)))
         self.src_info.pack(anchor="w", padx=self.s(8), pady=(0, self.s(8)))
@@ -598,17 +929,14 @@ class ProfessionalDITApp(ctk.CTk):
         dst_card = ctk.CTkFrame(left, fg_color="#161718", corner_radius=self.s(6))
         dst_card.pack(fill="x", padx=self.s(10), pady=self.s(10))
         ctk.CTkLabel(dst_card, text="Destinations", font=("Helvetica", self.sf(11), "bold")).pack(anchor="w", padx=self.s(8), pady=(self.s(8), 0))
-        self.dst1_display = ctk.CTkTextbox(dst_card, height=self.s(48), fg_color="#0b0c0d", font=("Courier", self.sf(10)))
+        self.dst1_display = ctk.CTkEntry(dst_card, textvariable=self.dst1_path, state="readonly", fg_color="#0b0c0d", font=("Courier", self.sf(10)))
         self.dst1_display.pack(fill="x", padx=self.s(8), pady=self.s(6))
-        self.dst1_display.insert("1.0", "No destination selected")
-        self.dst1_display.configure(state="disabled")
         ctk.CTkButton(dst_card, text="Browse Primary", command=lambda: self.browse("dst1"), width=self.s(120)).pack(side="left", padx=self.s(8), pady=(0, self.s(8)))
         
-        self.dst2_display = ctk.CTkTextbox(dst_card, height=self.s(48), fg_color="#0b0c0d", font=("Courier", self.sf(10)))
+        self.dst2_display = ctk.CTkEntry(dst_card, textvariable=self.dst2_path, state="readonly", fg_color="#0b0c0d", font=("Courier", self.sf(10)))
         self.dst2_display.pack(fill="x", padx=self.s(8), pady=self.s(6))
-        self.dst2_display.insert("1.0", "No destination selected")
-        self.dst2_display.configure(state="disabled")
         ctk.CTkButton(dst_card, text="Browse Backup", command=lambda: self.browse("dst2"), width=self.s(120)).pack(side="left", padx=self.s(8), pady=(0, self.s(8)))
+        ctk.CTkButton(dst_card, text="Clear", command=self.clear_backup, width=self.s(60)).pack(side="left", padx=(0, self.s(8)), pady=(0, self.s(8)))
 
         # Transfer options in left inspector
         options_card = ctk.CTkFrame(left, fg_color="#161718", corner_radius=self.s(6))
@@ -618,8 +946,11 @@ class ProfessionalDITApp(ctk.CTk):
         transfers_frame.pack(fill="x", padx=self.s(8), pady=self.s(8))
         ctk.CTkLabel(transfers_frame, text="Parallel Transfers:").pack(side="left")
         self.transfers_var = tk.StringVar(value="4")
-        transfers_spinbox = ctk.CTkOptionMenu(transfers_frame, values=["1", "2", "4", "8", "16"], variable=self.transfers_var, width=self.s(80))
+        transfers_spinbox = ctk.CTkOptionMenu(transfers_frame, values=["1", "2", "4", "8", "16"], variable=self.transfers_var, width=self.s(80), command=lambda value: self._update_config(transfers=value))
         transfers_spinbox.pack(side="right")
+        self.fast_verify_var = tk.BooleanVar(value=False)
+        ctk.CTkCheckBox(options_card, text="Fast verify (trust copy-time checksums)", variable=self.fast_verify_var,
+                        command=lambda: self._update_config(fast_verify=self.fast_verify_var.get())).pack(anchor="w", padx=self.s(8), pady=(0, self.s(8)))
 
         # Control buttons stacked like Resolve render controls
         controls_card = ctk.CTkFrame(left, fg_color="#161718", corner_radius=self.s(6))
@@ -681,8 +1012,20 @@ class ProfessionalDITApp(ctk.CTk):
         ctk.CTkLabel(log_card, text="Transfer Log", font=("Helvetica", self.sf(11), "bold")).pack(anchor="w", padx=self.s(8), pady=(self.s(8), 0))
         self.log_display = ctk.CTkTextbox(log_card, height=self.s(220), fg_color="#0b0c0d", font=("Courier", self.sf(10)))
         self.log_display.pack(fill="both", expand=False, padx=self.s(8), pady=self.s(8))
+        for level, color in self.LOG_COLORS.items():
+            self.log_display.tag_config(level, foreground=color)
         self.log_display.insert("1.0", "Log initialized. Ready for transfer.\n")
-        self.log_display.configure(state="disabled")
+        self._log_line_count = 1
+        self._log_buffer = []
+        self._log_flush_scheduled = False
+        # restoring a minimized window only maps the toplevel, not the textbox
+        self.bind("<Map>", self._on_window_map, add="+")
+        # Read-only by swallowing edits, so appends need no state="normal"/"disabled" toggling
+        # Control everywhere; Command (Mod1) only on macOS - elsewhere 0x08 can be Num Lock
+        self._copy_key_mask = 0x04 | (0x08 if self.tk.call("tk", "windowingsystem") == "aqua" else 0)
+        self.log_display.bind("<Key>", self._block_log_edit)
+        for sequence in ("<<Paste>>", "<<Cut>>", "<<Clear>>", "<<PasteSelection>>"):
+            self.log_display.bind(sequence, lambda e: "break")
 
         # Footer with log path
         status_bar = ctk.CTkFrame(self, height=self.s(36), fg_color="#0b0c0d")
@@ -694,102 +1037,231 @@ class ProfessionalDITApp(ctk.CTk):
         """Browse for directory"""
         dir_path = filedialog.askdirectory(title=f"Select {target} directory")
         if dir_path:
+            getattr(self, f"{target}_path").set(dir_path)
             if target == "src":
-                self.src_display.configure(state="normal")
-                self.src_display.delete("1.0", "end")
-                self.src_display.insert("1.0", dir_path)
-                self.src_display.configure(state="disabled")
                 self.update_source_info(dir_path)
-            elif target == "dst1":
-                self.dst1_display.configure(state="normal")
-                self.dst1_display.delete("1.0", "end")
-                self.dst1_display.insert("1.0", dir_path)
-                self.dst1_display.configure(state="disabled")
-            elif target == "dst2":
-                self.dst2_display.configure(state="normal")
-                self.dst2_display.delete("1.0", "end")
-                self.dst2_display.insert("1.0", dir_path)
-                self.dst2_display.configure(state="disabled")
             
-            self.save_config()
+            self._update_config(**{target: dir_path})
+    
+    def clear_backup(self):
+        """Drop the backup destination so transfers only go to the primary"""
+        self.dst2_path.set("")
+        self._update_config(dst2="")
     
     def update_source_info(self, src_path):
-        """Update source file count and size info"""
+        """Update source file count and size info (the walk runs in the background)"""
+        self._scan_generation += 1
+        self._src_scan = None
+        self._scan_cancel.set()
+        self._scan_cancel = cancel = threading.Event()
         try:
-            if os.path.exists(src_path) and os.path.isdir(src_path):
-                total_size = 0
-                file_count = 0
-                for root, dirs, files in os.walk(src_path):
-                    for file in files:
-                        try:
-                            file_path = os.path.join(root, file)
-                            total_size += os.path.getsize(file_path)
-                            file_count += 1
-                        except OSError:
-                            pass
-                
-                size_gb = total_size / 1e9
-                self.src_info.configure(text=f"{file_count} files | {size_gb:.2f} GB")
-        except Exception as e:
+            workers = int(self.transfers_var.get()) * 2
+        except ValueError:
+            workers = 1
+        self.src_info.configure(text="Scanning...")
+        threading.Thread(target=self._scan_source, args=(src_path, workers, self._scan_generation, cancel), daemon=True).start()
+    
+    def _scan_source(self, src_path, workers, generation, cancel):
+        """Walk the source tree off the Tk thread and hand the result to it"""
+        scan = None
+        try:
+            if os.path.isdir(src_path):
+                root_mtime = os.stat(src_path).st_mtime_ns
+                total_size, file_count = _walk_sizes(src_path, workers, cancel)
+                scan = (src_path, root_mtime, total_size, file_count)
+        except Exception:
+            scan = False
+        if cancel.is_set():
+            return
+        try:
+            self.after(0, partial(self._apply_source_scan, generation, scan))
+        except Exception:
+            pass
+    
+    def _apply_source_scan(self, generation, scan):
+        if generation != self._scan_generation:
+            return
+        if scan is False:
             self.src_info.configure(text="Error calculating size")
+        elif scan:
+            self._src_scan = scan
+            self.src_info.configure(text=f"{scan[3]} files | {scan[2] / 1e9:.2f} GB")
+        else:
+            self.src_info.configure(text="0 files | 0 GB")
     
     def ui_callback(self, action, *args):
         """Thread-safe UI updates from transfer engine"""  
-        def update():
-            if action == "log":
-                msg, level = args
-                color = {
-                    "INFO": "#ffffff",
-                    "SUCCESS": "#28a745",
-                    "WARNING": "#ffc107",
-                    "ERROR": "#dc3545"
-                }.get(level, "#ffffff")
-                try:
-                    self.log_display.tag_config(level, foreground=color)
-                except Exception:
-                    pass
-                self.log_display.configure(state="normal")
-                self.log_display.insert("end", f"{msg}\n", level)
-                self.log_display.see("end")
-                self.log_display.configure(state="disabled")
-                # Also push into queue list for visibility
-                try:
-                    self.queue_list.insert("end", msg)
-                    self.queue_list.see("end")
-                except Exception:
-                    pass
-            elif action == "progress":
-                percentage, speed, eta = args
-                try:
+        if action == "log":
+            # count lines here, on the producer thread, so the Tk flush only does widget work
+            msg, level = args
+            args = (msg, level, msg.count("\n") + 1)
+        # Queue the event and wake the Tk main loop with a virtual event; only
+        # the first event of a batch needs to wake it.
+        with self._event_lock:
+            if self._closing:
+                return
+            events = self._event_queue
+            if action in self.COALESCED_EVENTS and events and events[-1][0] == action:
+                # a newer value supersedes one the UI has not drawn yet
+                events[-1] = (action, args)
+            else:
+                if len(events) >= self.MAX_QUEUED_EVENTS:
+                    self._drop_oldest_event()
+                events.append((action, args))
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        try:
+            self.event_generate("<<DITEvent>>", when="tail")
+        except Exception:
+            pass
+    
+    def _drop_oldest_event(self):
+        """Make room in a full event queue, sacrificing the oldest progress/log update first (lock held)"""
+        for i, (action, _) in enumerate(self._event_queue):
+            if action in self.DROPPABLE_EVENTS:
+                del self._event_queue[i]
+                return
+        self._event_queue.popleft()
+    
+    def _schedule_event_flush(self, event=None):
+        self.after(self.EVENT_FLUSH_MS, self._flush_events)
+    
+    def _flush_events(self):
+        """Dispatch a batch of queued engine events"""
+        with self._event_lock:
+            self._flush_scheduled = False
+            count = min(len(self._event_queue), self.MAX_EVENTS_PER_FLUSH)
+            batch = [self._event_queue.popleft() for _ in range(count)]
+        for action, args in batch:
+            self._dispatch_event(action, args)
+        with self._event_lock:
+            if not self._event_queue or self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self._schedule_event_flush()
+    
+    def _dispatch_event(self, action, args):
+        """Apply a single engine event to the widgets (Tk thread only)"""
+        if action == "log":
+            self._log_buffer.append(args)
+            if not self._log_flush_scheduled:
+                self._log_flush_scheduled = True
+                self.after(self.LOG_FLUSH_MS, self._flush_log)
+        elif action == "progress":
+            # coalesced batches often repeat the same stats; skip the redraw
+            if args == self._last_progress:
+                return
+            _, last_speed, last_eta = self._last_progress or (None, None, None)
+            self._last_progress = args
+            percentage, speed, eta = args
+            try:
+                if speed != last_speed:
                     self.speed_label.configure(text=speed)
+                if eta != last_eta:
                     self.eta_label.configure(text=eta)
-                except Exception:
-                    pass
-                try:
-                    target = max(0, min(100, int(percentage)))
-                except Exception:
-                    target = 0
-                self.animate_progress_to(target)
-            elif action == "current_file":
-                filename = args[0]
-                self.current_file_label.configure(text=filename)
-            elif action == "status":
-                status = args[0]
+            except Exception:
+                pass
+            try:
+                target = max(0, min(100, int(percentage)))
+            except Exception:
+                target = 0
+            self.animate_progress_to(target)
+        elif action == "current_file":
+            filename = args[0]
+            if filename != self._last_current_file:
+                self._last_current_file = filename
+                self.current_file_label.configure(text=_truncate_display(filename))
+        elif action == "status":
+            status = args[0]
+            if status != self._last_status:
+                self._last_status = status
                 self.status_label.configure(text=status)
-            elif action == "dialog":
-                kind, title, message = args
-                try:
-                    if kind == "info":
-                        messagebox.showinfo(title, message)
-                    elif kind == "warning":
-                        messagebox.showwarning(title, message)
-                    elif kind == "error":
-                        messagebox.showerror(title, message)
-                except Exception:
-                    pass
-        
-        self.after(0, update)
+        elif action == "dialog":
+            # Get the final log lines on screen, then open the modal once Tk is
+            # idle so it does not block the rest of this batch.
+            self._flush_log()
+            self.after_idle(partial(self._show_dialog, *args))
+        elif action == "reset":
+            # queued like any other event so it lands after the progress it clears
+            self.reset_ui()
+    
+    def _show_dialog(self, kind, title, message):
+        try:
+            if kind == "info":
+                messagebox.showinfo(title, message)
+            elif kind == "warning":
+                messagebox.showwarning(title, message)
+            elif kind == "error":
+                messagebox.showerror(title, message)
+        except Exception:
+            pass
 
+    def _block_log_edit(self, event):
+        """Let copy, select-all and navigation keys through to the log; swallow everything else"""
+        if event.state & self._copy_key_mask and event.keysym.lower() in ("c", "a"):
+            return None
+        if event.keysym in ("Up", "Down", "Left", "Right", "Prior", "Next", "Home", "End"):
+            return None
+        return "break"
+    
+    def _on_window_map(self, event):
+        # children re-fire the toplevel's <Map> binding through their bindtags
+        if event.widget is self:
+            self._flush_log()
+    
+    def _flush_log(self):
+        """Write buffered log lines with one insert and one tag_add per run of same-level lines"""
+        self._log_flush_scheduled = False
+        if not self._log_buffer:
+            return
+        if not self.log_display.winfo_viewable():
+            # window minimized: keep (a bounded tail of) the lines until <Map> flushes them
+            if len(self._log_buffer) > self.MAX_LOG_LINES + self.LOG_TRIM_SLACK:
+                del self._log_buffer[:-self.MAX_LOG_LINES]
+            return
+        entries, self._log_buffer = self._log_buffer, []
+        
+        # the textbox holds exactly _log_line_count complete lines, so new text starts on the next one
+        first_line = self._log_line_count + 1
+        line_no = first_line
+        ranges = []  # [level, start_line, end_line)
+        for _, level, n in entries:
+            if ranges and ranges[-1][0] == level:
+                ranges[-1][2] = line_no + n
+            else:
+                ranges.append([level, line_no, line_no + n])
+            line_no += n
+        
+        # only auto-scroll if the user is already looking at the tail of the log
+        follow = self.log_display.yview()[1] >= 0.99
+        self.log_display.insert("end", "\n".join([e[0] for e in entries]) + "\n")
+        for level, start, end in ranges:
+            self.log_display.tag_add(level, f"{start}.0", f"{end}.0")
+        self._log_line_count += line_no - first_line
+        if self._log_line_count > self.MAX_LOG_LINES + self.LOG_TRIM_SLACK:
+            self._trim_log()
+        if follow:
+            self.log_display.see("end")
+        # Also push into queue list for visibility
+        try:
+            self.queue_list.insert("end", *[e[0] for e in entries])
+            self.queue_list.see("end")
+        except Exception:
+            pass
+    
+    def _trim_log(self):
+        """Drop the oldest lines from the log and queue views in one delete each"""
+        excess = self._log_line_count - self.MAX_LOG_LINES
+        self.log_display.delete("1.0", f"{excess + 1}.0")
+        self._log_line_count = self.MAX_LOG_LINES
+        try:
+            extra = self.queue_list.size() - self.MAX_LOG_LINES
+            if extra > 0:
+                self.queue_list.delete(0, extra - 1)
+        except Exception:
+            pass
+    
     def animate_progress_to(self, target_percentage, step_delay=8):
         self._target_percentage = target_percentage
         if self._progress_animating:
@@ -818,22 +1290,27 @@ class ProfessionalDITApp(ctk.CTk):
                 messagebox.showwarning("Warning", "Transfer already in progress or paused. Resume or abort first.")
                 return
         
-        src = self.src_display.get("1.0", "end-1c").strip()
-        dst1 = self.dst1_display.get("1.0", "end-1c").strip()
+        src = self.src_path.get()
+        dst1 = self.dst1_path.get()
+        dst2 = self.dst2_path.get()
         
-        if not src or src == "No source selected":
+        if not src:
             messagebox.showerror("Error", "Please select a source directory")
             return
         
-        if not dst1 or dst1 == "No destination selected":
+        if not dst1:
             messagebox.showerror("Error", "Please select at least one destination")
             return
         
         try:
             transfers = int(self.transfers_var.get())
+            fast_verify = self.fast_verify_var.get()
+            dests = [dst1] if not dst2 or dst2 == dst1 else [dst1, dst2]
+            self._update_config(src=src, dst1=dst1, transfers=self.transfers_var.get())
             self.engine = TransferEngine(self.logger, self.ui_callback)
+            job = _TransferJob(self.engine, len(dests))
             with self._state_lock:
-                self.current_transfer_args = (src, dst1, transfers)
+                self.current_transfer_args = (src, dests, transfers, fast_verify, job)
                 self.is_transferring = True
                 self.is_paused = False
             self.start_btn.configure(state="disabled")
@@ -843,8 +1320,9 @@ class ProfessionalDITApp(ctk.CTk):
             self._target_percentage = 0
             self.progress_bar.set(0)
             self.progress_label.configure(text="0%")
-            self.queue_list.insert("end", f"Queued: {os.path.basename(src)} -> {os.path.basename(dst1)}")
-            self.transfer_thread = threading.Thread(target=self.run_transfer, args=(src, dst1, transfers, False), daemon=True)
+            for dst in dests:
+                self.queue_list.insert("end", f"Queued: {os.path.basename(src)} -> {os.path.basename(dst)}")
+            self.transfer_thread = threading.Thread(target=self.run_transfer, args=(job, src, dests, transfers, False, fast_verify), daemon=True)
             self.transfer_thread.start()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start transfer: {str(e)}")
@@ -853,24 +1331,42 @@ class ProfessionalDITApp(ctk.CTk):
                 self.is_transferring = False
                 self.current_transfer_args = None
     
-    def run_transfer(self, src, dst, transfers, resume=False):
+    def run_transfer(self, job, src, dests, transfers, resume=False, fast_verify=False):
         """Run the transfer process (called from thread)"""
+        # Copies run one at a time on this thread; each finished destination's
+        # verify + MHL is handed to the job's stage pool so it overlaps the next
+        # copy. The job outlives a pause, so a resumed run still waits for (and
+        # fails on) destinations that were copied before it.
+        engine = job.engine
         try:
             if not resume:
                 self.ui_callback("status", "Preflight check...")
-                self.engine.preflight_check(src, dst)
-            self.ui_callback("status", "Transferring...")
-            return_code = self.engine.run_rclone_copy(src, dst, transfers)
-            if return_code == 0:
-                self.ui_callback("status", "Verifying...")
-                self.engine.verify_transfer(src, dst)
-                self.ui_callback("status", "Creating MHL...")
-                self.engine.create_mhl(dst)
-                self.ui_callback("log", "Transfer completed successfully!", "SUCCESS")
-                self.ui_callback("status", "Complete")
-                self.after(0, lambda: messagebox.showinfo("Success", "Transfer completed successfully!"))
-            else:
-                raise ValueError(f"Rclone exited with code {return_code}")
+                engine.preflight_check(src, dests, transfers, self._src_scan)
+            for i, dst in enumerate(dests):
+                self.ui_callback("status", "Transferring...")
+                return_code = engine.run_rclone_copy(src, dst, transfers)
+                if return_code != 0:
+                    raise ValueError(f"Rclone exited with code {return_code}")
+                job.stages.append((dst, job.stage_pool.submit(self._finish_destination, engine, src, dst, fast_verify)))
+                with self._state_lock:
+                    self.current_transfer_args = (src, dests[i + 1:], transfers, fast_verify, job)
+            
+            self.ui_callback("status", "Verifying...")
+            failed = []
+            for dst, stage in job.stages:
+                try:
+                    stage.result()
+                except AbortRequested:
+                    raise
+                except Exception as e:
+                    failed.append(f"{dst}: {e}")
+            if engine.aborted:
+                raise AbortRequested("Transfer aborted by user")
+            if failed:
+                raise ValueError("Verification failed for " + "; ".join(failed))
+            self.ui_callback("log", "Transfer completed successfully!", "SUCCESS")
+            self.ui_callback("status", "Complete")
+            self.ui_callback("dialog", "info", "Success", "Transfer completed successfully!")
         except PauseRequested as p:
             with self._state_lock:
                 self.is_paused = True
@@ -878,30 +1374,58 @@ class ProfessionalDITApp(ctk.CTk):
             self.ui_callback("log", str(p), "INFO")
             self.ui_callback("status", "Paused")
             try:
-                self.after(0, lambda: self.pause_btn.configure(text="RESUME"))
+                self.after(0, partial(self.pause_btn.configure, text="RESUME"))
             except Exception:
                 pass
             self.logger.info(f"Transfer paused: {p}")
         except AbortRequested as a:
+            self._end_stages(job)
             self.ui_callback("log", str(a), "WARNING")
             self.ui_callback("status", "Aborted")
             self.logger.warning(f"Transfer aborted: {a}")
-            self.after(0, lambda: messagebox.showwarning("Aborted", "Transfer was aborted by user"))
+            self.ui_callback("dialog", "warning", "Aborted", "Transfer was aborted by user")
             with self._state_lock:
-                self.is_transferring = False
-                self.is_paused = False
-                self.current_transfer_args = None
+                # a new job may already have been started after the abort
+                if self.engine is engine:
+                    self.is_transferring = False
+                    self.is_paused = False
+                    self.current_transfer_args = None
         except Exception as e:
+            self._end_stages(job)
             error_msg = f"Transfer failed: {str(e)}"
             self.ui_callback("log", error_msg, "ERROR")
             self.ui_callback("status", "Failed")
-            self.after(0, lambda: messagebox.showerror("Error", error_msg))
+            self.ui_callback("dialog", "error", "Error", error_msg)
             self.logger.error(f"Transfer error: {e}")
         finally:
+            self.logger.flush()
             with self._state_lock:
                 paused = self.is_paused
             if not paused:
-                self.after(0, self.reset_ui)
+                job.stage_pool.shutdown(wait=False)
+                if self.engine is engine:
+                    self.ui_callback("reset")
+    
+    def _end_stages(self, job):
+        """Stop the verify/MHL stages of a job that has ended and wait for them to exit"""
+        # aborted makes running rclone check / ascmhl calls kill their process
+        # and stages that have not started yet return without doing anything
+        job.engine.aborted = True
+        job.stage_pool.shutdown(wait=True)
+    
+    def _finish_destination(self, engine, src, dst, fast_verify):
+        """Verify a copied destination and write its MHL (runs on the stage pool)"""
+        if engine.aborted:
+            return
+        try:
+            engine.verify_transfer(src, dst, fast=fast_verify)
+            engine.create_mhl(dst)
+        except AbortRequested:
+            raise
+        except Exception as e:
+            self.ui_callback("log", f"Verification of {dst} failed: {e}", "ERROR")
+            raise
+        self.ui_callback("log", f"Destination verified: {dst}", "SUCCESS")
     
     def toggle_pause(self):
         with self._state_lock:
@@ -929,8 +1453,8 @@ class ProfessionalDITApp(ctk.CTk):
                 with self._state_lock:
                     args = self.current_transfer_args
                 if args:
-                    src, dst, transfers = args
-                    self.transfer_thread = threading.Thread(target=self.run_transfer, args=(src, dst, transfers, True), daemon=True)
+                    src, dests, transfers, fast_verify, job = args
+                    self.transfer_thread = threading.Thread(target=self.run_transfer, args=(job, src, dests, transfers, True, fast_verify), daemon=True)
                     self.transfer_thread.start()
             except Exception as e:
                 self.ui_callback("log", f"Failed to resume: {e}", "ERROR")
@@ -940,6 +1464,7 @@ class ProfessionalDITApp(ctk.CTk):
         with self._state_lock:
             engine = self.engine
             is_transferring = self.is_transferring
+            args = self.current_transfer_args
         
         if engine and is_transferring:
             if messagebox.askyesno("Confirm", "Abort the current transfer? This will stop now."):
@@ -955,7 +1480,10 @@ class ProfessionalDITApp(ctk.CTk):
                         self.is_paused = False
                         self.current_transfer_args = None
                         self.is_transferring = False
-                    self.after(0, self.reset_ui)
+                    if args:
+                        # a paused job has no transfer thread to release its stage pool
+                        args[4].stage_pool.shutdown(wait=False)
+                    self.ui_callback("reset")
     
     def reset_ui(self):
         with self._state_lock:
@@ -965,7 +1493,9 @@ class ProfessionalDITApp(ctk.CTk):
         self.start_btn.configure(state="normal")
         self.pause_btn.configure(state="disabled", text="PAUSE")
         self.abort_btn.configure(state="disabled")
+        self._last_progress = None
         self.animate_progress_to(0)
+        self._last_current_file = "Waiting..."
         self.current_file_label.configure(text="Waiting...")
         self.speed_label.configure(text="0 MB/s")
         self.eta_label.configure(text="--:--:--")
@@ -983,35 +1513,45 @@ class ProfessionalDITApp(ctk.CTk):
             self.scale = max(0.5, min(self.scale, 3.0))
             
             if src:
-                self.src_display.configure(state="normal")
-                self.src_display.delete("1.0", "end")
-                self.src_display.insert("1.0", src)
-                self.src_display.configure(state="disabled")
+                self.src_path.set(src)
                 self.update_source_info(src)
             
             if dst1:
-                self.dst1_display.configure(state="normal")
-                self.dst1_display.delete("1.0", "end")
-                self.dst1_display.insert("1.0", dst1)
-                self.dst1_display.configure(state="disabled")
+                self.dst1_path.set(dst1)
             
             if dst2:
-                self.dst2_display.configure(state="normal")
-                self.dst2_display.delete("1.0", "end")
-                self.dst2_display.insert("1.0", dst2)
-                self.dst2_display.configure(state="disabled")
+                self.dst2_path.set(dst2)
             
             self.transfers_var.set(transfers)
+            self.fast_verify_var.set(bool(self.config.get("fast_verify", False)))
     
     def save_config(self):
-        config = {
-            "src": self.src_display.get("1.0", "end-1c").strip() if self.src_display.get("1.0", "end-1c") != "No source selected" else "",
-            "dst1": self.dst1_display.get("1.0", "end-1c").strip() if self.dst1_display.get("1.0", "end-1c") != "No destination selected" else "",
-            "dst2": self.dst2_display.get("1.0", "end-1c").strip() if self.dst2_display.get("1.0", "end-1c") != "No destination selected" else "",
-            "transfers": self.transfers_var.get(),
-            "scaling": self.scale
-        }
-        ConfigManager.save(config)
+        self.config["scaling"] = self.scale
+        ConfigManager.save(self.config)
+    
+    def _update_config(self, **values):
+        """Apply several settings at once and schedule a single save if any changed"""
+        changed = False
+        for key, value in values.items():
+            if self.config.get(key) != value:
+                self.config[key] = value
+                changed = True
+        if changed:
+            self._schedule_config_save()
+    
+    def _schedule_config_save(self):
+        """Mark the config dirty and (re)arm a debounced save"""
+        self._cfg_dirty = True
+        if self._config_save_job is not None:
+            self.after_cancel(self._config_save_job)
+        self._config_save_job = self.after(self.CONFIG_SAVE_DELAY_MS, self._do_config_save)
+    
+    def _do_config_save(self):
+        self._config_save_job = None
+        if not self._cfg_dirty:
+            return
+        self._cfg_dirty = False
+        self.save_config()
     
     def on_closing(self):
         with self._state_lock:
@@ -1021,12 +1561,24 @@ class ProfessionalDITApp(ctk.CTk):
             if messagebox.askyesno("Confirm", "Transfer in progress. Close anyway?"):
                 if engine:
                     try:
-                        engine.abort()
+                        # the app is exiting; don't hold the window open for a slow rclone shutdown
+                        engine.abort(timeout=0.5)
                     except Exception:
                         pass
-                self.destroy()
+                self._shutdown()
         else:
-            self.destroy()
+            self._shutdown()
+    
+    def _shutdown(self):
+        """Stop accepting engine events, close the log and destroy the window"""
+        with self._event_lock:
+            self._closing = True
+        if self._config_save_job is not None:
+            self.after_cancel(self._config_save_job)
+            self._do_config_save()
+        self._scan_cancel.set()
+        self.logger.close()
+        self.destroy()
 
 if __name__ == "__main__":
     app = ProfessionalDITApp()